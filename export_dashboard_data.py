@@ -6,150 +6,203 @@ Exports all interesting insights and statistics to JSON for web dashboard
 
 import pandas as pd
 import numpy as np
-import json
+import heapq
+import orjson
 from datetime import datetime
 from collections import Counter
+from pathlib import Path
+
+# Columns consumed by the exporters; everything else is skipped at parse time
+POST_COLUMNS = [
+    'id', 'title', 'upvotes', 'comment_count', 'author_name',
+    'submolt_display_name', 'created_at', 'url'
+]
+AUTHOR_STATS_COLUMNS = [
+    'total_posts', 'engagement_rate', 'avg_upvotes', 'success_rate',
+    'posts_per_day', 'consistency_score', 'upvotes_std'
+]
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
 def load_all_data():
     """Load all analysis results"""
     print("Loading data...")
     
+    # The pyarrow engine parses ISO 8601 created_at values while tokenizing;
+    # passing date_format would add a second to_datetime pass after the read
     data = {
-        'posts': pd.read_csv('data/posts_latest.csv'),
-        'author_stats': pd.read_csv('data/author_stats.csv'),
+        'posts': pd.read_csv(
+            'data/posts_latest.csv', engine='pyarrow', dtype_backend='pyarrow',
+            usecols=POST_COLUMNS, parse_dates=['created_at']
+        ),
+        'author_stats': pd.read_csv(
+            'data/author_stats.csv', engine='pyarrow', dtype_backend='pyarrow',
+            usecols=AUTHOR_STATS_COLUMNS
+        ),
     }
     
+    # Fill missing values once here instead of copying the frame per exporter
+    posts = data['posts']
+    posts['title'] = posts['title'].fillna('')
+    posts['upvotes'] = posts['upvotes'].fillna(0)
+    posts['comment_count'] = posts['comment_count'].fillna(0)
+    data['author_stats'] = data['author_stats'].fillna(0)
+    
+    # Store name columns as categoricals so nunique/groupby work on integer
+    # codes; missing names stay NaN and are labelled 'Unknown' on export
+    for col in ('author_name', 'submolt_display_name'):
+        posts[col] = posts[col].astype('category')
+    
+    # Derive time fields once so exporters don't re-parse created_at
+    created_at = posts['created_at'].dt
+    data['post_hour'] = created_at.hour
+    data['post_day'] = pd.Series(
+        pd.Categorical(created_at.day_name(), categories=DAY_ORDER, ordered=True),
+        index=posts.index
+    )
+    
     # Load JSON files if they exist
-    try:
-        with open('data/cross_posters.json', 'r') as f:
-            data['cross_posters'] = json.load(f)
-    except:
-        data['cross_posters'] = {}
-    
-    try:
-        with open('data/bridge_authors.json', 'r') as f:
-            data['bridge_authors'] = json.load(f)
-    except:
-        data['bridge_authors'] = {}
-    
-    try:
-        with open('data/network_stats.json', 'r') as f:
-            data['network_stats'] = json.load(f)
-    except:
-        data['network_stats'] = {}
+    for key in ('cross_posters', 'bridge_authors', 'network_stats'):
+        path = Path(f'data/{key}.json')
+        data[key] = orjson.loads(path.read_bytes()) if path.exists() else {}
     
     return data
 
-def export_overview_stats(data):
+def _column_stats(df):
+    """Compute the column reductions shared by the overview and insights"""
+    # np.quantile partitions in place, so only copy when pandas handed back
+    # a read-only view (float columns without nulls); int columns convert
+    # into a fresh writable array already
+    upvotes = df['upvotes'].to_numpy(dtype=np.float64)
+    if not upvotes.flags.writeable:
+        upvotes = upvotes.copy()
+    comments = df['comment_count'].to_numpy(dtype=np.float64)
+    
+    stats = {
+        'n_posts': len(df),
+        'n_authors': int(df['author_name'].nunique()),
+        'n_submolts': int(df['submolt_display_name'].nunique()),
+        'upvotes_sum': 0.0, 'upvotes_mean': 0.0, 'upvotes_median': 0.0,
+        'upvotes_q90': 0.0, 'upvotes_q99': 0.0,
+        'comments_sum': 0.0, 'comments_mean': 0.0
+    }
+    if upvotes.size:
+        total = upvotes.sum()
+        q50, q90, q99 = np.quantile(upvotes, [0.5, 0.9, 0.99], overwrite_input=True)
+        stats.update({
+            'upvotes_sum': float(total),
+            'upvotes_mean': float(total / upvotes.size),
+            'upvotes_median': float(q50),
+            'upvotes_q90': float(q90),
+            'upvotes_q99': float(q99)
+        })
+    if comments.size:
+        total = comments.sum()
+        stats['comments_sum'] = float(total)
+        stats['comments_mean'] = float(total / comments.size)
+    
+    return stats
+
+def export_overview_stats(data, stats):
     """Export high-level overview statistics"""
     df = data['posts']
     
     overview = {
-        'total_posts': int(len(df)),
-        'total_authors': int(df['author_name'].nunique()),
-        'total_submolts': int(df['submolt_display_name'].nunique()),
-        'total_upvotes': int(df['upvotes'].sum()),
-        'total_comments': int(df['comment_count'].sum()),
-        'avg_upvotes_per_post': float(df['upvotes'].mean()),
-        'median_upvotes': float(df['upvotes'].median()),
-        'avg_comments_per_post': float(df['comment_count'].mean()),
+        'total_posts': stats['n_posts'],
+        'total_authors': stats['n_authors'],
+        'total_submolts': stats['n_submolts'],
+        'total_upvotes': int(stats['upvotes_sum']),
+        'total_comments': int(stats['comments_sum']),
+        'avg_upvotes_per_post': stats['upvotes_mean'],
+        'median_upvotes': stats['upvotes_median'],
+        'avg_comments_per_post': stats['comments_mean'],
         'date_range': {
-            'start': str(df['created_at'].min()),
-            'end': str(df['created_at'].max())
+            'start': df['created_at'].min().isoformat(),
+            'end': df['created_at'].max().isoformat()
         }
     }
     
     return overview
 
+def _records(frame):
+    """Convert a small, already-coerced frame into a list of plain dicts"""
+    cols = tuple(frame.columns)
+    dict_, zip_ = dict, zip
+    return [dict_(zip_(cols, row)) for row in frame.itertuples(index=False, name=None)]
+
 def export_top_posts(data, n=20):
     """Export top posts by upvotes"""
     df = data['posts']
     
-    # Replace NaN values before export
-    df = df.fillna({'title': '', 'author_name': 'Unknown', 'submolt_display_name': 'Unknown'})
-    
-    top_posts = df.nlargest(n, 'upvotes')[
+    top = df.nlargest(n, 'upvotes')[
         ['title', 'upvotes', 'comment_count', 'author_name', 'submolt_display_name', 'created_at']
-    ].to_dict('records')
+    ].copy()
     
-    # Convert to serializable format
-    for post in top_posts:
-        post['upvotes'] = int(post['upvotes']) if pd.notna(post['upvotes']) else 0
-        post['comment_count'] = int(post['comment_count']) if pd.notna(post['comment_count']) else 0
-        post['created_at'] = str(post['created_at']) if pd.notna(post['created_at']) else ''
-        post['title'] = str(post['title']) if post['title'] else 'Untitled'
+    # Convert to serializable format column-wise before building records
+    top['upvotes'] = top['upvotes'].astype('int64')
+    top['comment_count'] = top['comment_count'].astype('int64')
+    top['created_at'] = top['created_at'].map(pd.Timestamp.isoformat, na_action='ignore').fillna('')
+    top['title'] = top['title'].where(top['title'] != '', 'Untitled')
+    for col in ('author_name', 'submolt_display_name'):
+        top[col] = top[col].astype(object).fillna('Unknown')
     
-    return top_posts
+    return _records(top)
+
+def _top_authors_by(author_stats, key, cols, n):
+    """Export the top n authors by key with the given float columns"""
+    top = author_stats.nlargest(n, key)[cols].astype(float)
+    top['total_posts'] = top['total_posts'].astype(int)
+    top.insert(0, 'name', top.index.astype(str))
+    return _records(top)
 
 def export_top_authors(data, n=20):
     """Export top authors by various metrics"""
-    author_stats = data['author_stats'].fillna(0)
+    author_stats = data['author_stats']
+    active = author_stats[author_stats['total_posts'] >= 5]
     
     top_authors = {
-        'by_engagement': [],
-        'by_posts': [],
-        'by_consistency': []
+        # By engagement rate
+        'by_engagement': _top_authors_by(
+            active, 'engagement_rate',
+            ['engagement_rate', 'total_posts', 'avg_upvotes', 'success_rate'], n
+        ),
+        # By post count
+        'by_posts': _top_authors_by(
+            author_stats, 'total_posts',
+            ['total_posts', 'avg_upvotes', 'posts_per_day'], n
+        ),
+        # By consistency
+        'by_consistency': _top_authors_by(
+            active, 'consistency_score',
+            ['consistency_score', 'total_posts', 'avg_upvotes', 'upvotes_std'], n
+        )
     }
     
-    # By engagement rate
-    active = author_stats[author_stats['total_posts'] >= 5]
-    for _, row in active.nlargest(n, 'engagement_rate').iterrows():
-        top_authors['by_engagement'].append({
-            'name': str(row.name),
-            'engagement_rate': float(row['engagement_rate']) if pd.notna(row['engagement_rate']) else 0.0,
-            'total_posts': int(row['total_posts']) if pd.notna(row['total_posts']) else 0,
-            'avg_upvotes': float(row['avg_upvotes']) if pd.notna(row['avg_upvotes']) else 0.0,
-            'success_rate': float(row['success_rate']) if pd.notna(row['success_rate']) else 0.0
-        })
-    
-    # By post count
-    for _, row in author_stats.nlargest(n, 'total_posts').iterrows():
-        top_authors['by_posts'].append({
-            'name': str(row.name),
-            'total_posts': int(row['total_posts']) if pd.notna(row['total_posts']) else 0,
-            'avg_upvotes': float(row['avg_upvotes']) if pd.notna(row['avg_upvotes']) else 0.0,
-            'posts_per_day': float(row['posts_per_day']) if pd.notna(row['posts_per_day']) else 0.0
-        })
-    
-    # By consistency
-    for _, row in active.nlargest(n, 'consistency_score').iterrows():
-        top_authors['by_consistency'].append({
-            'name': str(row.name),
-            'consistency_score': float(row['consistency_score']) if pd.notna(row['consistency_score']) else 0.0,
-            'total_posts': int(row['total_posts']) if pd.notna(row['total_posts']) else 0,
-            'avg_upvotes': float(row['avg_upvotes']) if pd.notna(row['avg_upvotes']) else 0.0,
-            'upvotes_std': float(row['upvotes_std']) if pd.notna(row['upvotes_std']) else 0.0
-        })
-    
     return top_authors
 
 def export_submolt_stats(data, n=30):
     """Export submolt statistics"""
-    df = data['posts'].fillna({'submolt_display_name': 'Unknown', 'upvotes': 0, 'comment_count': 0})
+    df = data['posts']
     
-    submolt_stats = df.groupby('submolt_display_name').agg({
-        'id': 'count',
-        'upvotes': ['sum', 'mean', 'median'],
-        'comment_count': ['sum', 'mean'],
-        'author_name': lambda x: x.nunique()
-    }).round(2).fillna(0)
-    
-    submolt_stats.columns = ['_'.join(col).strip() for col in submolt_stats.columns.values]
-    submolt_stats = submolt_stats.rename(columns={
-        'id_count': 'post_count',
-        'upvotes_sum': 'total_upvotes',
-        'upvotes_mean': 'avg_upvotes',
-        'upvotes_median': 'median_upvotes',
-        'comment_count_sum': 'total_comments',
-        'comment_count_mean': 'avg_comments',
-        'author_name_<lambda>': 'unique_authors'
-    })
+    # Pick the busiest submolts with a cheap count, then aggregate only those
+    post_counts = df.groupby('submolt_display_name', observed=True, dropna=False)['id'].count()
+    top_names = post_counts.nlargest(n).index
+    df = df[df['submolt_display_name'].isin(top_names)]
+    
+    submolt_stats = df.groupby('submolt_display_name', observed=True, dropna=False).agg(
+        post_count=('id', 'count'),
+        total_upvotes=('upvotes', 'sum'),
+        avg_upvotes=('upvotes', 'mean'),
+        median_upvotes=('upvotes', 'median'),
+        total_comments=('comment_count', 'sum'),
+        avg_comments=('comment_count', 'mean'),
+        unique_authors=('author_name', 'nunique')
+    ).round(2).fillna(0)
     
     # Top submolts
     top_submolts = []
     for submolt, row in submolt_stats.nlargest(n, 'post_count').iterrows():
         top_submolts.append({
-            'name': submolt,
+            'name': submolt if pd.notna(submolt) else 'Unknown',
             'post_count': int(row['post_count']),
             'total_upvotes': int(row['total_upvotes']),
             'avg_upvotes': float(row['avg_upvotes']),
@@ -161,38 +214,59 @@ def export_submolt_stats(data, n=30):
     
     return top_submolts
 
-def export_time_series(data):
-    """Export time series data for charts"""
-    df = data['posts'].copy().fillna({'upvotes': 0})
-    df['created_at'] = pd.to_datetime(df['created_at'])
-    df['date'] = df['created_at'].dt.date
-    df['hour'] = df['created_at'].dt.hour
-    df['day_of_week'] = df['created_at'].dt.day_name()
-    
-    # Daily posts
-    daily = df.groupby('date').agg({
+def _bucket_means(keys, values, size):
+    """Return per-bucket counts and mean values for integer keys in [0, size)"""
+    counts = np.bincount(keys, minlength=size)
+    sums = np.bincount(keys, weights=values, minlength=size)
+    means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0)
+    return counts, means
+
+def build_time_aggregates(data):
+    """Aggregate posts by date, hour and weekday for the time-based sections"""
+    df = data['posts']
+    
+    # Daily posts (count/sum over filled columns can't produce NaN)
+    daily = df.groupby(df['created_at'].dt.date.rename('date')).agg({
         'id': 'count',
         'upvotes': 'sum'
-    }).reset_index().fillna(0)
+    }).reset_index()
     daily['date'] = daily['date'].astype(str)
     
+    # Hour (0-23) and weekday (0-6) are bounded, so bucket them with bincount
+    day_codes = data['post_day'].cat.codes.to_numpy()
+    timed = day_codes >= 0
+    upvotes = df['upvotes'].to_numpy(dtype=np.float64)[timed]
+    hours = data['post_hour'][timed].to_numpy(dtype=np.int64)
+    
     # Hourly patterns
-    hourly = df.groupby('hour').agg({
-        'id': 'count',
-        'upvotes': 'mean'
-    }).reset_index().fillna(0)
+    hour_counts, hour_means = _bucket_means(hours, upvotes, 24)
+    seen = hour_counts > 0
+    hourly = pd.DataFrame({
+        'hour': np.flatnonzero(seen),
+        'id': hour_counts[seen],
+        'upvotes': hour_means[seen]
+    })
     
     # Day of week
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    daily_pattern = df.groupby('day_of_week').agg({
-        'id': 'count',
-        'upvotes': 'mean'
-    }).reindex(day_order).reset_index().fillna(0)
+    day_counts, day_means = _bucket_means(day_codes[timed], upvotes, 7)
+    daily_pattern = pd.DataFrame({
+        'day_of_week': DAY_ORDER,
+        'id': day_counts,
+        'upvotes': day_means
+    })
     
     return {
-        'daily_posts': daily.to_dict('records'),
-        'hourly_pattern': hourly.to_dict('records'),
-        'day_of_week_pattern': daily_pattern.to_dict('records')
+        'daily': daily,
+        'hourly': hourly,
+        'daily_pattern': daily_pattern
+    }
+
+def export_time_series(time_aggregates):
+    """Export time series data for charts"""
+    return {
+        'daily_posts': time_aggregates['daily'].to_dict('records'),
+        'hourly_pattern': time_aggregates['hourly'].to_dict('records'),
+        'day_of_week_pattern': time_aggregates['daily_pattern'].to_dict('records')
     }
 
 def export_network_data(data):
@@ -205,21 +279,20 @@ def export_network_data(data):
     
     # Top cross-posters
     cross_posters = data.get('cross_posters', {})
-    cross_poster_counts = [(author, len(submolts)) for author, submolts in cross_posters.items()]
-    cross_poster_counts.sort(key=lambda x: x[1], reverse=True)
+    top_cross = heapq.nlargest(20, cross_posters.items(), key=lambda x: len(x[1]))
     
-    for author, count in cross_poster_counts[:20]:
+    for author, submolts in top_cross:
         network['top_cross_posters'].append({
             'author': author,
-            'submolt_count': count,
-            'submolts': cross_posters[author][:5]  # First 5 submolts
+            'submolt_count': len(submolts),
+            'submolts': submolts[:5]  # First 5 submolts
         })
     
     # Top bridge authors
     bridge_authors = data.get('bridge_authors', {})
-    bridge_sorted = sorted(bridge_authors.items(), key=lambda x: x[1], reverse=True)
+    top_bridge = heapq.nlargest(20, bridge_authors.items(), key=lambda x: x[1])
     
-    for author, score in bridge_sorted[:20]:
+    for author, score in top_bridge:
         network['top_bridge_authors'].append({
             'author': author,
             'bridge_score': float(score)
@@ -227,33 +300,38 @@ def export_network_data(data):
     
     return network
 
-def export_insights(data):
+def export_insights(data, stats, time_aggregates):
     """Export key insights and findings"""
-    df = data['posts'].fillna({'upvotes': 0, 'title': '', 'url': ''})
-    author_stats = data['author_stats'].fillna(0)
+    df = data['posts']
+    author_stats = data['author_stats']
+    
+    # Best posting slot by mean upvotes, reusing the time series buckets
+    hourly = time_aggregates['hourly']
+    daily_pattern = time_aggregates['daily_pattern']
+    daily_pattern = daily_pattern[daily_pattern['id'] > 0]
     
     insights = {
         'engagement': {
-            'avg_upvotes': float(df['upvotes'].mean()) if not df['upvotes'].isna().all() else 0.0,
-            'median_upvotes': float(df['upvotes'].median()) if not df['upvotes'].isna().all() else 0.0,
-            'top_1_percent_threshold': float(df['upvotes'].quantile(0.99)) if not df['upvotes'].isna().all() else 0.0,
-            'viral_threshold': float(df['upvotes'].quantile(0.90)) if not df['upvotes'].isna().all() else 0.0
+            'avg_upvotes': stats['upvotes_mean'],
+            'median_upvotes': stats['upvotes_median'],
+            'top_1_percent_threshold': stats['upvotes_q99'],
+            'viral_threshold': stats['upvotes_q90']
         },
         'authors': {
-            'total': int(df['author_name'].nunique()),
+            'total': stats['n_authors'],
             'active_5plus': int(len(author_stats[author_stats['total_posts'] >= 5])),
-            'avg_posts_per_author': float(author_stats['total_posts'].mean()) if not author_stats['total_posts'].isna().all() else 0.0,
+            'avg_posts_per_author': float(author_stats['total_posts'].mean()) if len(author_stats) > 0 else 0.0,
             'cross_posting_rate': float(len(data.get('cross_posters', {})) / len(author_stats) * 100) if len(author_stats) > 0 else 0.0
         },
         'content': {
-            'total_posts': int(len(df)),
-            'total_submolts': int(df['submolt_display_name'].nunique()),
-            'avg_title_length': float(df['title'].str.len().mean()) if not df['title'].isna().all() else 0.0,
+            'total_posts': stats['n_posts'],
+            'total_submolts': stats['n_submolts'],
+            'avg_title_length': float(df['title'].str.len().mean()) if len(df) > 0 else 0.0,
             'posts_with_urls': int(df['url'].notna().sum())
         },
         'timing': {
-            'best_hour': int(df.groupby(pd.to_datetime(df['created_at']).dt.hour)['upvotes'].mean().fillna(0).idxmax()),
-            'best_day': str(df.groupby(pd.to_datetime(df['created_at']).dt.day_name())['upvotes'].mean().fillna(0).idxmax())
+            'best_hour': int(hourly.loc[hourly['upvotes'].idxmax(), 'hour']),
+            'best_day': str(daily_pattern.loc[daily_pattern['upvotes'].idxmax(), 'day_of_week'])
         }
     }
     
@@ -266,26 +344,28 @@ def main():
     
     # Load all data
     data = load_all_data()
+    stats = _column_stats(data['posts'])
+    time_aggregates = build_time_aggregates(data)
     
     # Export all sections
     dashboard_data = {
         'generated_at': datetime.now().isoformat(),
-        'overview': export_overview_stats(data),
+        'overview': export_overview_stats(data, stats),
         'top_posts': export_top_posts(data),
         'top_authors': export_top_authors(data),
         'top_submolts': export_submolt_stats(data),
-        'time_series': export_time_series(data),
+        'time_series': export_time_series(time_aggregates),
         'network': export_network_data(data),
-        'insights': export_insights(data)
+        'insights': export_insights(data, stats, time_aggregates)
     }
     
-    # Save to JSON (replace NaN with null)
+    # Save to JSON (orjson writes NaN as null and handles numpy scalars)
     output_path = 'dashboard_data.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dashboard_data, f, indent=2, ensure_ascii=False, allow_nan=False)
+    payload = orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    Path(output_path).write_bytes(payload)
     
     print(f"\n✅ Dashboard data exported to {output_path}")
-    print(f"   File size: {len(json.dumps(dashboard_data)) / 1024:.1f} KB")
+    print(f"   File size: {len(payload) / 1024:.1f} KB")
     print(f"\n📊 Data Summary:")
     print(f"   Posts: {dashboard_data['overview']['total_posts']:,}")
     print(f"   Authors: {dashboard_data['overview']['total_authors']:,}")